@@ -116,16 +116,23 @@ public:
 	}
 
 	std::string DoubleMetaphoneEncode(const std::string &value, bool use_alternate) {
+		auto res = DoubleMetaphoneEncodeBoth(value);
+		return use_alternate ? res.Alternate() : res.Primary();
+	}
+
+	// Single walk over the input that yields both codes; the primary and
+	// alternate encodings are built side by side in DoubleMetaphoneResult.
+	DoubleMetaphoneResult DoubleMetaphoneEncodeBoth(const std::string &value) {
+		DoubleMetaphoneResult res(max_code_len_);
+
 		auto cleaned = CleanInput(value);
 		if (cleaned.empty()) {
-			return {};
+			return res;
 		}
 
 		bool slavo_germanic = IsSlavoGermanic(cleaned);
 		int32_t index = IsSilentStart(cleaned) ? 1 : 0;
 
-		DoubleMetaphoneResult res(max_code_len_);
-
 		while (!res.IsComplete() && index < static_cast<int32_t>(cleaned.size())) {
 			char ch = cleaned[static_cast<size_t>(index)];
 			switch (ch) {
@@ -217,7 +224,7 @@ public:
 				break;
 			}
 		}
-		return use_alternate ? res.Alternate() : res.Primary();
+		return res;
 	}
 
 	// Utility – compare two strings’ metaphones ----------------------------------
@@ -8,7 +8,9 @@
 #include <string_view>
 #include <cstdint>
 #include <cstdlib>
+#include <cstring>
 #include <array>
+#include <limits>
 #include "utf8proc_compat.hpp"
 #include <string>
 #include <unordered_map>
@@ -84,10 +86,146 @@ inline bool DefinitelyAboveK(const std::u32string &a, const std::u32string &b, i
 	return (imbalance >> 1) > k; // divide by 2 without fp
 }
 
+/* ------------------------------------------------------------------------- */
+/*  ASCII detection – ASCII bytes are code points, so no UTF-32 decode       */
+/* ------------------------------------------------------------------------- */
+inline bool IsAscii(std::string_view s) {
+	const char *p = s.data();
+	size_t n = s.size();
+	// 8 bytes at a time: any byte with the high bit set is non-ASCII
+	for (; n >= 8; p += 8, n -= 8) {
+		uint64_t word;
+		std::memcpy(&word, p, 8);
+		if (word & 0x8080808080808080ULL) {
+			return false;
+		}
+	}
+	for (; n > 0; ++p, --n) {
+		if (static_cast<unsigned char>(*p) & 0x80) {
+			return false;
+		}
+	}
+	return true;
+}
+
+/* ------------------------------------------------------------------------- */
+/*  Bit-parallel Levenshtein (Hyyrö 2003) over bytes                         */
+/*                                                                           */
+/*  The DP column for the pattern `a` is encoded as vertical +1/-1 delta     */
+/*  bit-vectors (VP/VN), W 64-bit words long, so each character of `b`       */
+/*  costs O(W) bitwise ops instead of O(|a|) cell updates.  Requires         */
+/*  0 < |a| <= 64 * W.  Returns max_dist + 1 once the distance provably      */
+/*  exceeds max_dist.                                                        */
+/* ------------------------------------------------------------------------- */
+template <size_t W>
+inline int64_t LevenshteinHyyro(std::string_view a, std::string_view b, int64_t max_dist) {
+	const size_t m = a.size();
+	const size_t n = b.size();
+
+	// Per-character match masks for the pattern
+	uint64_t pm[W][256] = {};
+	for (size_t i = 0; i < m; ++i) {
+		pm[i / 64][static_cast<unsigned char>(a[i])] |= uint64_t(1) << (i % 64);
+	}
+
+	uint64_t vp[W];
+	uint64_t vn[W];
+	for (size_t w = 0; w < W; ++w) {
+		vp[w] = ~uint64_t(0);
+		vn[w] = 0;
+	}
+	const uint64_t last = uint64_t(1) << ((m - 1) % 64);
+	int64_t score = static_cast<int64_t>(m);
+
+	for (size_t j = 0; j < n; ++j) {
+		const unsigned char ch = static_cast<unsigned char>(b[j]);
+		// Row 0 of the DP table is 0..n, so the horizontal delta entering word 0 is +1
+		uint64_t hp_carry = 1;
+		uint64_t hn_carry = 0;
+
+		for (size_t w = 0; w < W; ++w) {
+			const uint64_t x = pm[w][ch] | hn_carry;
+			const uint64_t d0 = (((x & vp[w]) + vp[w]) ^ vp[w]) | x | vn[w];
+			uint64_t hp = vn[w] | ~(d0 | vp[w]);
+			uint64_t hn = d0 & vp[w];
+
+			if (w == W - 1) {
+				score += (hp & last) ? 1 : 0;
+				score -= (hn & last) ? 1 : 0;
+			}
+
+			const uint64_t hp_in = hp_carry;
+			const uint64_t hn_in = hn_carry;
+			hp_carry = hp >> 63;
+			hn_carry = hn >> 63;
+			hp = (hp << 1) | hp_in;
+			hn = (hn << 1) | hn_in;
+
+			vp[w] = hn | ~(d0 | hp);
+			vn[w] = hp & d0;
+		}
+
+		// Each remaining character of `b` can lower the score by at most one
+		if (score - static_cast<int64_t>(n - j - 1) > max_dist) {
+			return max_dist + 1;
+		}
+	}
+	return score;
+}
+
+/* ------------------------------------------------------------------------- */
+/*  Byte-level Levenshtein with length dispatch                              */
+/* ------------------------------------------------------------------------- */
+inline int64_t AsciiLevenshteinDistance(std::string_view a, std::string_view b,
+                                        int64_t max_dist = std::numeric_limits<int64_t>::max()) {
+	// The shorter string is the bit-vector pattern
+	if (a.size() > b.size()) {
+		std::swap(a, b);
+	}
+	// Every edit changes the length by at most one
+	const int64_t len_diff = static_cast<int64_t>(b.size() - a.size());
+	if (len_diff > max_dist) {
+		return max_dist + 1;
+	}
+
+	// Common prefix/suffix never contribute to the distance
+	while (!a.empty() && a.front() == b.front()) {
+		a.remove_prefix(1);
+		b.remove_prefix(1);
+	}
+	while (!a.empty() && a.back() == b.back()) {
+		a.remove_suffix(1);
+		b.remove_suffix(1);
+	}
+	if (a.empty()) {
+		return len_diff;
+	}
+
+	// With the affixes gone the strings differ at both ends, so a single edit
+	// only suffices when one character of `b` is left – no DP needed for k <= 1.
+	if (max_dist <= 1) {
+		return b.size() <= 1 ? static_cast<int64_t>(b.size()) : max_dist + 1;
+	}
+
+	if (a.size() <= 64) {
+		return LevenshteinHyyro<1>(a, b, max_dist);
+	}
+	if (a.size() <= 128) {
+		return LevenshteinHyyro<2>(a, b, max_dist);
+	}
+	if (max_dist == std::numeric_limits<int64_t>::max()) {
+		return static_cast<int64_t>(rapidfuzz::levenshtein_distance(a, b));
+	}
+	return static_cast<int64_t>(rapidfuzz::levenshtein_distance(a, b, {1, 1, 1}, static_cast<size_t>(max_dist)));
+}
+
 namespace duckdb {
 
 // --- Two-argument versions (no threshold) ---
 inline int64_t LevenshteinDistance(const std::string_view a, const std::string_view b) {
+	if (IsAscii(a) && IsAscii(b)) {
+		return AsciiLevenshteinDistance(a, b);
+	}
 	auto ua = Utf8ToU32(a);
 	auto ub = Utf8ToU32(b);
 	return static_cast<int64_t>(rapidfuzz::levenshtein_distance(ua, ub));
@@ -99,6 +237,9 @@ inline int64_t LevenshteinDistance(const std::string_view a, const std::string_v
 	if (max_dist < 0) {
 		return LevenshteinDistance(a, b); // Fallback for negative threshold
 	}
+	if (IsAscii(a) && IsAscii(b)) {
+		return AsciiLevenshteinDistance(a, b, max_dist);
+	}
 	auto ua = Utf8ToU32(a);
 	auto ub = Utf8ToU32(b);
 	// Note: The {1, 1, 1} represents the weights for (insertion, deletion, substitution)
@@ -107,6 +248,9 @@ inline int64_t LevenshteinDistance(const std::string_view a, const std::string_v
 
 // --- Damerau-Levenshtein (Two-argument version) ---
 inline int64_t DamerauLevenshteinDistance(const std::string_view a, const std::string_view b) {
+	if (IsAscii(a) && IsAscii(b)) {
+		return static_cast<int64_t>(rapidfuzz::experimental::damerau_levenshtein_distance(a, b));
+	}
 	auto ua = Utf8ToU32(a);
 	auto ub = Utf8ToU32(b);
 	// Note: The function is in the 'experimental' namespace in this version of rapidfuzz
@@ -119,6 +263,14 @@ inline int64_t DamerauLevenshteinDistance(std::string_view a, std::string_view b
 		return DamerauLevenshteinDistance(a, b); // Fallback for negative threshold
 	}
 
+	if (IsAscii(a) && IsAscii(b)) {
+		if (DefinitelyAboveK(a, b, static_cast<int>(max_dist))) {
+			return max_dist + 1;
+		}
+		return static_cast<int64_t>(
+		    rapidfuzz::experimental::damerau_levenshtein_distance(a, b, static_cast<size_t>(max_dist)));
+	}
+
 	// --- Decode UTF‑8 → UTF‑32 ----------------------------------------
 	auto ua = Utf8ToU32(a);
 	auto ub = Utf8ToU32(b);
@@ -0,0 +1,103 @@
+#pragma once
+
+#include "duckdb.hpp"
+#include "duckdb/common/types/vector.hpp"
+#include "duckdb/function/scalar_function.hpp"
+
+namespace duckdb {
+
+// -------------------- Byte helpers --------------------
+// Separators are ASCII whitespace plus `,` `.` `'`.  Bytes of multi-byte UTF-8
+// sequences are all >= 0x80, so splitting never cuts a code point in half.
+static inline bool IsCleanTokensSeparator(unsigned char ch) {
+	switch (ch) {
+	case ' ':
+	case '\t':
+	case '\n':
+	case '\v':
+	case '\f':
+	case '\r':
+	case ',':
+	case '.':
+	case '\'':
+		return true;
+	default:
+		return false;
+	}
+}
+
+static inline char AsciiUpper(unsigned char ch) {
+	return static_cast<char>((ch >= 'a' && ch <= 'z') ? ch - ('a' - 'A') : ch);
+}
+
+// -------------------- Executor --------------------
+// Single pass per string: upper-case ASCII letters, treat separators as token
+// boundaries (collapsing runs), and write each token straight into the list
+// child vector.
+static void CleanTokensExec(DataChunk &args, ExpressionState & /*state*/, Vector &result) {
+	const idx_t count = args.size();
+	auto &input = args.data[0];
+
+	UnifiedVectorFormat input_format;
+	input.ToUnifiedFormat(count, input_format);
+	auto inputs = UnifiedVectorFormat::GetData<string_t>(input_format);
+
+	result.SetVectorType(VectorType::FLAT_VECTOR);
+	auto list_entries = FlatVector::GetData<list_entry_t>(result);
+	auto &child = ListVector::GetEntry(result);
+
+	idx_t child_offset = 0;
+
+	for (idx_t row = 0; row < count; ++row) {
+		auto input_idx = input_format.sel->get_index(row);
+		list_entry_t &entry = list_entries[row];
+		entry.offset = child_offset;
+		entry.length = 0;
+
+		if (!input_format.validity.RowIsValid(input_idx)) {
+			FlatVector::SetNull(result, row, true);
+			continue;
+		}
+
+		const string_t &in = inputs[input_idx];
+		const auto *data = reinterpret_cast<const unsigned char *>(in.GetData());
+		const idx_t size = in.GetSize();
+
+		idx_t pos = 0;
+		while (pos < size) {
+			while (pos < size && IsCleanTokensSeparator(data[pos])) {
+				++pos;
+			}
+			if (pos == size) {
+				break;
+			}
+			const idx_t start = pos;
+			while (pos < size && !IsCleanTokensSeparator(data[pos])) {
+				++pos;
+			}
+
+			ListVector::Reserve(result, child_offset + 1);
+			string_t token = StringVector::EmptyString(child, pos - start);
+			char *out = token.GetDataWriteable();
+			for (idx_t i = start; i < pos; ++i) {
+				*out++ = AsciiUpper(data[i]);
+			}
+			token.Finalize();
+			FlatVector::GetData<string_t>(child)[child_offset++] = token;
+		}
+
+		entry.length = child_offset - entry.offset;
+	}
+
+	ListVector::SetListSize(result, child_offset);
+}
+
+//===--------------------------------------------------------------------===//
+// Registrar – call from the extension's LoadInternal()
+//===--------------------------------------------------------------------===//
+static inline void RegisterCleanTokens(ExtensionLoader &loader) {
+	loader.RegisterFunction(ScalarFunction("clean_tokens", {LogicalType::VARCHAR},
+	                                       LogicalType::LIST(LogicalType::VARCHAR), CleanTokensExec));
+}
+
+} // namespace duckdb
@@ -8,6 +8,7 @@
 #include "phonetic/double_metaphone.hpp"
 #include "rapidfuzz/string_comparison.hpp"
 #include "arrays/ngrams.hpp"
+#include "text/clean_tokens.hpp"
 
 namespace duckdb {
 
@@ -155,9 +156,10 @@ static void DoubleMetaphoneScalarList(DataChunk &data_chunk, ExpressionState & /
 
 		std::string_view sv(in.GetDataUnsafe(), in.GetSize());
 
-		// ---- generate codes -------------------------------------------------
-		std::string primary = encoder.DoubleMetaphoneEncode(std::string(sv), false);
-		std::string alternate = encoder.DoubleMetaphoneEncode(std::string(sv), true);
+		// ---- generate codes (one pass yields primary + alternate) -----------
+		auto codes = encoder.DoubleMetaphoneEncodeBoth(std::string(sv));
+		const std::string &primary = codes.Primary();
+		const std::string &alternate = codes.Alternate();
 
 		// ---- write into child vector ----------------------------------------
 		list_entry_t &entry = list_entries[row];
@@ -208,6 +210,8 @@ static void LoadInternal(ExtensionLoader &loader) {
 	loader.RegisterFunction(damerau_set);
 
 	RegisterNgrams(loader);
+
+	RegisterCleanTokens(loader);
 }
 
 void SplinkUdfsExtension::Load(ExtensionLoader &loader) {
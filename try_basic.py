@@ -4,12 +4,16 @@
 # dependencies = [
 #     "duckdb",
 #     "jellyfish",
+#     "numpy",
+#     "pyarrow",
 # ]
 # ///
 
 import os
 import duckdb
 import jellyfish
+import pyarrow as pa
+from duckdb.sqltypes import VARCHAR
 
 # ───────────────────────────────────────────────────────────
 # 1.  Locate and load the custom DuckDB soundex extension
@@ -27,26 +31,44 @@ con.load_extension(ext_path)
 con.sql("select soundex('Robin') as s").show(max_width=10000)
 
 
-def compare_soundex(input_str):
-    """Compare DuckDB and Jellyfish soundex results for a given input."""
-    # Get DuckDB soundex result
-    duckdb_result = con.sql(f"select soundex('{input_str}') as s").fetchone()[0]
+def jf_soundex_arrow(arr: pa.Array) -> pa.Array:
+    """Vectorised jellyfish soundex: called once per DuckDB vector, not per row."""
+    return pa.array(
+        [None if s is None else jellyfish.soundex(s) for s in arr.to_pylist()],
+        type=pa.string(),
+    )
 
-    # Get Jellyfish soundex result
-    jellyfish_result = jellyfish.soundex(input_str)
 
-    # Check if results match
-    match = duckdb_result == jellyfish_result
+con.create_function("jf_soundex", jf_soundex_arrow, [VARCHAR], VARCHAR, type="arrow")
 
-    # Print formatted message
-    status = "🟢" if match else "🔴"
-    print(
-        f"Input: '{input_str}' | DuckDB: {duckdb_result} | Jellyfish: {jellyfish_result} | Match: {status}"
-    )
+
+def compare_soundex_batch(inputs: list[str]):
+    """Compare DuckDB and Jellyfish soundex results for a batch of inputs.
+
+    All inputs are scanned in a single query rather than one query per string.
+    """
+    con.register("probe", pa.table({"s": inputs}))
+    results = con.sql(
+        """
+        select
+            s,
+            soundex(s) as duck,
+            jf_soundex(s) as jf,
+            soundex(s) = jf_soundex(s) as match
+        from probe
+        """
+    ).to_arrow_table()
+    con.unregister("probe")
+
+    for row in results.to_pylist():
+        status = "🟢" if row["match"] else "🔴"
+        print(
+            f"Input: '{row['s']}' | DuckDB: {row['duck']} | Jellyfish: {row['jf']} | Match: {status}"
+        )
 
 
 # Test cases
-compare_soundex("Robert")
+compare_soundex_batch(["Robert", "Rupert", "Rubin", "Ashcraft", "Tymczak", "Pfister"])
 
 sql = """
 select strip_diacritics('Café') as stripped
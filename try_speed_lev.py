@@ -0,0 +1,142 @@
+#!/usr/bin/env -S uv run --quiet
+# /// script
+# requires-python = ">=3.12"
+# dependencies = [
+#     "duckdb",
+# ]
+# ///
+
+import argparse
+import os
+import time
+
+import duckdb
+
+parser = argparse.ArgumentParser(description="Benchmark the splink_udfs edit distances")
+parser.add_argument(
+    "--rebuild",
+    action="store_true",
+    help="regenerate the cached words table before benchmarking",
+)
+args = parser.parse_args()
+
+# ───────────────────────────────────────────────────────────
+# 1.  Locate and load the splink_udfs extension
+# ───────────────────────────────────────────────────────────
+ext_path = os.path.abspath(
+    os.path.join(
+        os.path.dirname(__file__),
+        "build/release/extension/splink_udfs/splink_udfs.duckdb_extension",
+    )
+)
+
+# The synthetic table is cached on disk so iterating on the UDFs only costs an
+# extension reload plus the benchmark scans.
+db_path = os.path.expanduser("~/.cache/splink_udfs/bench.duckdb")
+os.makedirs(os.path.dirname(db_path), exist_ok=True)
+
+con = duckdb.connect(db_path, config={"allow_unsigned_extensions": "true"})
+con.load_extension(ext_path)
+
+# Pin the thread count and silence the progress bar so timings are reproducible.
+# Nothing here needs ordered output, so let every thread scan and aggregate
+# without an order-preserving merge at the end.
+THREADS = os.cpu_count()
+con.execute(f"PRAGMA threads={THREADS}")
+con.execute("PRAGMA disable_progress_bar")
+con.execute("SET preserve_insertion_order = false")
+
+# ───────────────────────────────────────────────────────────
+# 2.  Synthetic word pairs
+# ───────────────────────────────────────────────────────────
+# Words are 3–30 char slices of a pool of random 64-char lowercase chunks, so
+# generation is a columnar list lookup + substr() rather than a per-row,
+# per-character lambda chain.  The pool is split into chunks because substr()
+# walks its input from the start, which would make slicing one huge string
+# O(pool size) per row.
+# Half of the pairs are near-duplicates (word2 is word1's slice shifted by
+# up to one char and resized by ±1) so thresholded distances are exercised.
+N_ROWS = 10_000_000
+N_CHUNKS = 4096
+CHUNK_LEN = 64
+
+sql_words = f"""
+CREATE OR REPLACE TABLE words AS
+WITH pool AS (
+    SELECT list(s) AS chunks
+    FROM (
+        SELECT string_agg(chr(97 + floor(random() * 26)::INT), '') AS s
+        FROM range({N_CHUNKS * CHUNK_LEN}) t(i)
+        GROUP BY i // {CHUNK_LEN}
+    )
+),
+params AS (
+    SELECT
+        1 + floor(random() * {N_CHUNKS})::INT AS c1,
+        1 + floor(random() * {N_CHUNKS})::INT AS c2,
+        1 + floor(random() * {CHUNK_LEN - 31})::INT AS o1,
+        1 + floor(random() * {CHUNK_LEN - 31})::INT AS o2,
+        3 + floor(random() * 28)::INT AS l1,
+        3 + floor(random() * 28)::INT AS l2,
+        random() < 0.5 AS near
+    FROM range({N_ROWS})
+)
+SELECT
+    substr(pool.chunks[c1], o1, l1) AS word1,
+    CASE
+        WHEN near THEN substr(pool.chunks[c1], o1 + l2 % 2, l1 + l2 % 3 - 1)
+        ELSE substr(pool.chunks[c2], o2, l2)
+    END AS word2
+FROM params, pool
+"""
+
+words_exists = con.execute(
+    "SELECT count(*) FROM information_schema.tables WHERE table_name = 'words'"
+).fetchone()[0]
+
+if args.rebuild or not words_exists:
+    # random() is only reproducible under setseed() on a single thread
+    t = time.perf_counter()
+    con.execute("PRAGMA threads=1")
+    con.execute("SELECT setseed(0.42)")
+    con.execute(sql_words)
+    con.execute(f"PRAGMA threads={THREADS}")
+    print(f"Built words ({N_ROWS:,} rows): {time.perf_counter() - t:.2f}s")
+else:
+    print(f"Using cached words from {db_path} (pass --rebuild to regenerate)")
+
+con.sql(
+    """
+    select
+        word1,
+        word2,
+        levenshtein(word1, word2) as lev,
+        damerau_levenshtein(word1, word2) as dlev
+    from words
+    limit 10
+    """
+).show(max_width=10000)
+
+# ───────────────────────────────────────────────────────────
+# 3.  Benchmarks
+# ───────────────────────────────────────────────────────────
+
+
+def bench(sql_expr, label):
+    """Time `sql_expr` over every row of `words`.
+
+    Results are reduced with sum() and fetched as a single row, so the timing
+    reflects the UDF rather than a GROUP BY or a DataFrame conversion.
+    """
+    t = time.perf_counter()
+    con.execute(f"SELECT sum(({sql_expr})::BIGINT) FROM words").fetchone()
+    print(f"{label}: {time.perf_counter() - t:.2f}s")
+
+
+print(f"Benchmarking with {THREADS} threads")
+bench("levenshtein(word1, word2)", "levenshtein")
+bench("levenshtein(word1, word2, 1)", "levenshtein (max 1)")
+bench("levenshtein(word1, word2, 3)", "levenshtein (max 3)")
+bench("damerau_levenshtein(word1, word2)", "damerau_levenshtein")
+bench("damerau_levenshtein(word1, word2, 1)", "damerau_levenshtein (max 1)")
+bench("damerau_levenshtein(word1, word2, 3)", "damerau_levenshtein (max 3)")